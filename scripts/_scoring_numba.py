@@ -0,0 +1,151 @@
+"""
+_scoring_numba.py - Numba-compiled heuristic scoring kernels
+
+Fused, single-pass version of the scoring formula in preprocess.py, used
+by preprocess.py --jit (serial) and --parallel (multi-core). Importing
+this module requires numba; callers treat ImportError as "kernel
+unavailable" and fall back to pure Python.
+
+Compiled code is cached on disk (cache=True), so only the first run pays
+the JIT compilation cost. The parallel kernel uses numba's thread pool,
+sized to the CPU count unless NUMBA_NUM_THREADS is set.
+"""
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True)
+def _score_one(
+    score: float,
+    num_comments: float,
+    created: float,
+    upvote_ratio: float,
+    length: int,
+    median_score: float,
+    start_ts: float,
+    window_duration: float,
+    weights: np.ndarray,
+    length_thresholds: np.ndarray,
+    content_scores: np.ndarray,
+    engagement_divisor: float,
+    comments_divisor: float
+) -> float:
+    """Compute the raw (0-1) weighted heuristic score of one post."""
+    # Engagement
+    engagement = 0.0
+    if score > 0:
+        engagement = math.log10(score + 1) / (
+            math.log10(max(median_score, 1.0) + 1) + engagement_divisor
+        )
+        engagement = min(1.0, engagement)
+
+    # Comments
+    comments = 0.0
+    if num_comments > 0:
+        comments = min(1.0, math.log10(num_comments + 1) / comments_divisor)
+
+    # Recency
+    recency = 0.5
+    if window_duration > 0:
+        recency = max(0.0, min(1.0, (created - start_ts) / window_duration))
+
+    # Content length bucket
+    bucket = 0
+    while bucket < length_thresholds.shape[0] and length >= length_thresholds[bucket]:
+        bucket += 1
+    content = content_scores[bucket]
+
+    # Upvote ratio
+    ratio = max(0.0, (upvote_ratio - 0.5) * 2)
+
+    return (
+        engagement * weights[0] +
+        comments * weights[1] +
+        recency * weights[2] +
+        content * weights[3] +
+        ratio * weights[4]
+    )
+
+
+@njit(cache=True)
+def score_kernel(
+    scores: np.ndarray,
+    num_comments: np.ndarray,
+    created: np.ndarray,
+    ratios: np.ndarray,
+    lengths: np.ndarray,
+    median_scores: np.ndarray,
+    start_ts: float,
+    window_duration: float,
+    weights: np.ndarray,
+    length_thresholds: np.ndarray,
+    content_scores: np.ndarray,
+    engagement_divisor: float,
+    comments_divisor: float
+) -> np.ndarray:
+    """
+    Compute the raw (0-1) weighted heuristic score of every post.
+
+    Args:
+        scores: Reddit score per post
+        num_comments: Comment count per post
+        created: Creation Unix timestamp per post
+        ratios: Upvote ratio per post
+        lengths: Title + selftext length per post
+        median_scores: Subreddit median score per post
+        start_ts: Time window start (Unix timestamp)
+        window_duration: Time window length in seconds
+        weights: (engagement, comments, recency, content, ratio) weights
+        length_thresholds: Ascending content length bucket boundaries
+        content_scores: Content score per length bucket (len(thresholds) + 1)
+        engagement_divisor: Engagement normalization offset
+        comments_divisor: Comment log-scale divisor
+
+    Returns:
+        Array of raw weighted scores, one per post
+    """
+    n = scores.shape[0]
+    out = np.empty(n)
+    for i in range(n):
+        out[i] = _score_one(
+            scores[i], num_comments[i], created[i], ratios[i], lengths[i],
+            median_scores[i], start_ts, window_duration, weights,
+            length_thresholds, content_scores, engagement_divisor, comments_divisor
+        )
+    return out
+
+
+@njit(parallel=True, cache=True)
+def score_kernel_parallel(
+    scores: np.ndarray,
+    num_comments: np.ndarray,
+    created: np.ndarray,
+    ratios: np.ndarray,
+    lengths: np.ndarray,
+    median_scores: np.ndarray,
+    start_ts: float,
+    window_duration: float,
+    weights: np.ndarray,
+    length_thresholds: np.ndarray,
+    content_scores: np.ndarray,
+    engagement_divisor: float,
+    comments_divisor: float
+) -> np.ndarray:
+    """
+    Multi-core version of score_kernel (same arguments and result).
+
+    Each iteration reads only its own inputs and writes only out[i], so
+    the prange loop needs no synchronization.
+    """
+    n = scores.shape[0]
+    out = np.empty(n)
+    for i in prange(n):
+        out[i] = _score_one(
+            scores[i], num_comments[i], created[i], ratios[i], lengths[i],
+            median_scores[i], start_ts, window_duration, weights,
+            length_thresholds, content_scores, engagement_divisor, comments_divisor
+        )
+    return out
@@ -18,19 +18,31 @@ Usage:
 
 Output:
     Writes JSON data to output/raw_posts.json
+    (or output/raw_posts.json.zst with --compress)
 """
 
 import argparse
-import json
+import heapq
 import sys
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
 
+import diskcache
+import ijson
+import orjson
 import praw
 import requests
-from prawcore.exceptions import ResponseException, OAuthException
+from requests.adapters import HTTPAdapter
+from prawcore.exceptions import ResponseException, OAuthException, PrawcoreException
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -41,6 +53,259 @@ MAX_SELFTEXT_LENGTH = 2000
 MAX_COMMENT_BODY_LENGTH = 1000
 REDDIT_API_MAX_LIMIT = 100
 
+# Concurrency defaults for unauthenticated fetching
+DEFAULT_MAX_CONCURRENCY = 8
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 16
+
+# Retry policy for transient HTTP failures (rate limiting, server errors)
+HTTP_MAX_RETRIES = 5
+HTTP_BACKOFF_FACTOR = 0.5
+HTTP_RETRY_STATUSES = (500, 502, 503, 504)
+
+# Requests the shared token bucket may issue back-to-back after idle time
+DEFAULT_RATE_LIMIT_BURST = 10
+
+# Concurrent comment tree fetches per subreddit (authenticated mode)
+COMMENT_FETCH_WORKERS = 8
+
+# zstandard level for --compress output (fast, still far smaller than plain JSON)
+ZSTD_LEVEL = 3
+
+# OAuth API host, used with PRAW's token for direct JSON requests
+REDDIT_OAUTH_URL = 'https://oauth.reddit.com'
+
+# Pushshift-compatible search API for server-side time-window queries
+PUSHSHIFT_SEARCH_URL = 'https://api.pullpush.io/reddit/search/submission/'
+PUSHSHIFT_PAGE_SIZE = 100
+
+# On-disk cache of fetched subreddit results
+DEFAULT_CACHE_DIR = '.cache/reddit'
+DEFAULT_CACHE_TTL = 3600
+CACHE_TIME_BUCKET_SECONDS = 3600
+
+# Pause authenticated fetching when fewer requests than this remain
+PRAW_RATE_LIMIT_THRESHOLD = 5
+
+# Subreddits combined into one r/a+b+c request (unauthenticated mode)
+SUBREDDIT_BATCH_SIZE = 10
+# Keep the joined multireddit path well under common URL length limits
+MAX_MULTIREDDIT_LENGTH = 500
+
+
+def _chunk(items: List[str], size: int, max_length: int = 0) -> List[List[str]]:
+    """
+    Split a list of names into consecutive chunks of at most `size` items.
+
+    Args:
+        items: Names to split
+        size: Maximum chunk size
+        max_length: If positive, also close a chunk before its '+'-joined
+            length would exceed this many characters
+
+    Returns:
+        List of chunks
+    """
+    chunks = []
+    current = []
+    current_length = 0
+    for item in items:
+        item_length = len(item) + (1 if current else 0)
+        if current and (len(current) >= size or
+                        (max_length > 0 and current_length + item_length > max_length)):
+            chunks.append(current)
+            current = []
+            current_length = 0
+            item_length = len(item)
+        current.append(item)
+        current_length += item_length
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _clip(text: str, limit: int) -> str:
+    """
+    Truncate text to a maximum length, reusing the original if it fits.
+
+    Args:
+        text: Text to truncate
+        limit: Maximum length
+
+    Returns:
+        The original string, or its first `limit` characters
+    """
+    return text if len(text) <= limit else text[:limit]
+
+
+def _iso_utc(timestamp: float) -> str:
+    """
+    Format a Unix timestamp as an ISO-8601 UTC string.
+
+    Equivalent to datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
+    for whole-second timestamps, without allocating a datetime.
+
+    Args:
+        timestamp: Unix timestamp
+
+    Returns:
+        String like "2025-01-01T00:00:00+00:00"
+    """
+    tm = time.gmtime(timestamp)
+    return (f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+            f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}+00:00")
+
+
+@dataclass
+class Post:
+    """
+    Normalized Reddit post.
+
+    Slotted to keep the per-post footprint small while fetching; orjson
+    serializes it to the raw_posts.json post layout at write time.
+    __slots__ is declared by hand (dataclass(slots=True) needs Python 3.10),
+    which is why no field has a class-level default.
+    """
+    __slots__ = (
+        'id', 'title', 'author', 'subreddit', 'score', 'upvote_ratio',
+        'num_comments', 'created_utc', 'created_datetime', 'url', 'permalink',
+        'selftext', 'is_self', 'link_flair_text', 'comments',
+    )
+
+    id: str
+    title: str
+    author: str
+    subreddit: str
+    score: int
+    upvote_ratio: float
+    num_comments: int
+    created_utc: float
+    created_datetime: str
+    url: str
+    permalink: str
+    selftext: str
+    is_self: bool
+    link_flair_text: str
+    comments: List[Dict]
+
+
+class IncompleteFetchError(Exception):
+    """
+    Raised by a fetch method that hit errors part-way through.
+
+    Carries whatever was fetched before the failure, so callers can still
+    use it while knowing it must not be cached.
+    """
+
+    def __init__(self, message: str, partial: Any):
+        super().__init__(message)
+        self.partial = partial
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by all request-issuing worker threads.
+
+    Tokens refill continuously at a fixed rate up to a burst capacity, so a
+    caller that has been idle proceeds immediately and only waits when the
+    budget is actually spent. A penalty blocks every caller, including ones
+    already queued, until its deadline passes.
+    """
+
+    def __init__(self, capacity: float, refill_per_sec: float):
+        """
+        Initialize the token bucket (starts full).
+
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            refill_per_sec: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._lock = threading.Lock()
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        # Monotonic deadline before which no caller may proceed
+        self._blocked_until = 0.0
+        # Bumped by each penalty so queued reservations know they are void
+        self._generation = 0
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last update (caller holds the lock)."""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_sec)
+            self._updated = now
+
+    def acquire(self, tokens: float = 1) -> None:
+        """
+        Take tokens from the bucket, sleeping only as long as needed.
+
+        A caller whose reservation is voided by a penalty while it sleeps
+        waits out the penalty and queues again.
+
+        Args:
+            tokens: Number of tokens to consume
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                    generation = None
+                else:
+                    self._refill(now)
+                    # Reserve the tokens now; a negative balance queues later callers
+                    self._tokens -= tokens
+                    wait = -self._tokens / self.refill_per_sec
+                    generation = self._generation
+            if wait > 0:
+                time.sleep(wait)
+            if generation is None:
+                continue
+            with self._lock:
+                if generation == self._generation:
+                    return
+
+    def penalize(self, seconds: float) -> None:
+        """
+        Block all callers, queued or new, for the given duration.
+
+        Outstanding reservations are voided and the bucket restarts empty
+        when the penalty ends, so queued callers are released at the refill
+        rate rather than all at once.
+
+        Args:
+            seconds: How long to hold off all callers
+        """
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until <= self._blocked_until:
+                return
+            self._blocked_until = until
+            self._tokens = 0
+            self._updated = until
+            self._generation += 1
+
+    def observe(self, headers: Any) -> None:
+        """
+        Update the bucket from Reddit's rate-limit response headers.
+
+        When the advertised budget is exhausted, no further requests are
+        released until the window resets.
+
+        Args:
+            headers: Response headers (case-insensitive mapping)
+        """
+        try:
+            remaining = float(headers.get('X-Ratelimit-Remaining', ''))
+            reset = float(headers.get('X-Ratelimit-Reset', ''))
+        except ValueError:
+            return
+
+        if remaining < 1:
+            self.penalize(reset)
+
 
 class RedditFetcher:
     """
@@ -67,11 +332,77 @@ class RedditFetcher:
         self.max_comments = self.fetch_config.get('max_comments_per_post', 20)
         self.min_score = self.fetch_config.get('min_score', 5)
         self.rate_limit_delay = self.fetch_config.get('rate_limit_delay', 2)
+        self.max_concurrency = self.fetch_config.get(
+            'max_concurrency', DEFAULT_MAX_CONCURRENCY
+        )
+        # Keep only the top-K posts by score across all subreddits (0 = keep all)
+        self.max_total_posts = self.fetch_config.get('max_total_posts', 0)
+        # Query the Pushshift-compatible archive before Reddit's own listings
+        self.use_pushshift = self.fetch_config.get('use_pushshift', False)
+
+        # Shared token bucket for JSON API requests: refills one request per
+        # rate_limit_delay on average, allowing short bursts after idle time
+        self.rate_limit_burst = self.fetch_config.get(
+            'rate_limit_burst', DEFAULT_RATE_LIMIT_BURST
+        )
+        self.rate_limiter = TokenBucket(
+            self.rate_limit_burst, 1.0 / max(self.rate_limit_delay, 0.001)
+        )
+
+        # Shared HTTP session so keep-alive connections are reused
+        self.http = self._init_http_session()
+        # Serializes OAuth token refreshes across comment fetch workers
+        self._token_lock = threading.Lock()
+
+        # Disk cache for fetched results, so re-runs within the TTL skip the API
+        self.cache_ttl = self.fetch_config.get('cache_ttl', DEFAULT_CACHE_TTL)
+        self.cache = None
+        if self.cache_ttl > 0:
+            self.cache = diskcache.Cache(
+                self.fetch_config.get('cache_dir', DEFAULT_CACHE_DIR)
+            )
 
         # Initialize Reddit client
         self.reddit = self._init_reddit_client()
         self.use_authenticated = self.reddit is not None
 
+    def _init_http_session(self) -> requests.Session:
+        """
+        Create a pooled HTTP session for the public JSON API.
+
+        Returns:
+            requests.Session with keep-alive connection pooling and retries
+        """
+        session = requests.Session()
+        session.headers.update({
+            'User-Agent': self.reddit_config.get('user_agent', 'AI-Reddit-Digest/1.0'),
+            'Connection': 'keep-alive',
+            # Listings are large JSON payloads; request them compressed
+            'Accept-Encoding': 'gzip, deflate',
+        })
+
+        # Retry transient server failures with exponential backoff. 429s are
+        # left to _http_get so every retry waits on the shared token bucket,
+        # and exhausted retries return the last response instead of raising.
+        retry = Retry(
+            total=HTTP_MAX_RETRIES,
+            backoff_factor=HTTP_BACKOFF_FACTOR,
+            status_forcelist=HTTP_RETRY_STATUSES,
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        # Keep at least one pooled connection per concurrent worker so no
+        # connection is discarded and re-handshaken under load
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=max(HTTP_POOL_MAXSIZE, self.max_concurrency)
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
     def _init_reddit_client(self) -> Optional[praw.Reddit]:
         """
         Initialize PRAW Reddit client if credentials are available.
@@ -107,122 +438,150 @@ class RedditFetcher:
             print("Falling back to unauthenticated mode", file=sys.stderr)
             return None
 
+    @staticmethod
     def _is_within_time_window(
-        self,
         timestamp: float,
-        start: datetime,
-        end: datetime
+        start_ts: float,
+        end_ts: float
     ) -> bool:
         """
         Check if a Unix timestamp falls within the time window.
 
+        Bounds are passed as precomputed Unix timestamps, so this is a plain
+        float comparison with no datetime allocation.
+
         Args:
             timestamp: Unix timestamp
-            start: Start datetime (UTC)
-            end: End datetime (UTC)
+            start_ts: Window start as a Unix timestamp
+            end_ts: Window end as a Unix timestamp
 
         Returns:
             True if timestamp is within window
         """
-        dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
-        return start <= dt <= end
+        return start_ts <= timestamp <= end_ts
 
-    def _get_attr(self, obj: Any, key: str, default: Any = None) -> Any:
+    def _extract_post_data_dict(self, post: Dict, subreddit_name: str) -> Post:
         """
-        Get attribute from dict or PRAW object uniformly.
+        Extract relevant data from a JSON API post payload.
 
         Args:
-            obj: Dict or PRAW object
-            key: Attribute/key name
-            default: Default value if not found
+            post: Post 'data' dict from a JSON API listing
+            subreddit_name: Name of the subreddit
 
         Returns:
-            The attribute value or default
+            Normalized Post
         """
-        if isinstance(obj, dict):
-            return obj.get(key, default)
-        return getattr(obj, key, default)
-
-    def _extract_post_data(self, post: Any, subreddit_name: str) -> Dict:
+        g = post.get
+        created_utc = g('created_utc', 0)
+
+        return Post(
+            id=g('id', ''),
+            title=g('title', ''),
+            author=g('author') or '[deleted]',
+            subreddit=subreddit_name,
+            score=g('score', 0),
+            upvote_ratio=g('upvote_ratio', 0),
+            num_comments=g('num_comments', 0),
+            created_utc=created_utc,
+            created_datetime=_iso_utc(created_utc),
+            url=g('url', ''),
+            permalink=f"https://reddit.com{g('permalink', '')}",
+            selftext=_clip(g('selftext') or '', MAX_SELFTEXT_LENGTH),
+            is_self=g('is_self', False),
+            link_flair_text=g('link_flair_text') or '',
+            comments=[]  # Will be populated later
+        )
+
+    def _extract_post_data_praw(self, post: Any, subreddit_name: str) -> Post:
         """
-        Extract relevant data from a Reddit post object.
+        Extract relevant data from a PRAW Submission.
 
         Args:
-            post: PRAW Submission object or dict from JSON API
+            post: PRAW Submission object
             subreddit_name: Name of the subreddit
 
         Returns:
-            Normalized post data dictionary
+            Normalized Post
         """
-        get = lambda k, d=None: self._get_attr(post, k, d)
-
-        author = get('author')
-        author_str = str(author) if author else '[deleted]'
-
-        created_utc = get('created_utc', 0)
-        selftext = get('selftext', '') or ''
-        link_flair = get('link_flair_text', '') or ''
-
-        return {
-            'id': get('id', ''),
-            'title': get('title', ''),
-            'author': author_str,
-            'subreddit': subreddit_name,
-            'score': get('score', 0),
-            'upvote_ratio': get('upvote_ratio', 0),
-            'num_comments': get('num_comments', 0),
-            'created_utc': created_utc,
-            'created_datetime': datetime.fromtimestamp(
-                created_utc, tz=timezone.utc
-            ).isoformat(),
-            'url': get('url', ''),
-            'permalink': f"https://reddit.com{get('permalink', '')}",
-            'selftext': selftext[:MAX_SELFTEXT_LENGTH],
-            'is_self': get('is_self', False),
-            'link_flair_text': link_flair,
-            'comments': []  # Will be populated later
-        }
-
-    def _extract_comment_data(self, comment: Any) -> Optional[Dict]:
+        # Redditor.name comes from the listing payload; never fetch the profile
+        author = post.author
+        created_utc = getattr(post, 'created_utc', 0)
+
+        return Post(
+            id=post.id,
+            title=getattr(post, 'title', ''),
+            author=author.name if author else '[deleted]',
+            subreddit=subreddit_name,
+            score=getattr(post, 'score', 0),
+            upvote_ratio=getattr(post, 'upvote_ratio', 0),
+            num_comments=getattr(post, 'num_comments', 0),
+            created_utc=created_utc,
+            created_datetime=_iso_utc(created_utc),
+            url=getattr(post, 'url', ''),
+            permalink=f"https://reddit.com{getattr(post, 'permalink', '')}",
+            selftext=_clip(getattr(post, 'selftext', '') or '', MAX_SELFTEXT_LENGTH),
+            is_self=getattr(post, 'is_self', False),
+            link_flair_text=getattr(post, 'link_flair_text', '') or '',
+            comments=[]  # Will be populated later
+        )
+
+    def _extract_comment_data_dict(self, comment: Dict) -> Optional[Dict]:
         """
-        Extract relevant data from a Reddit comment.
+        Extract relevant data from a JSON API comment payload.
 
         Args:
-            comment: PRAW Comment object or dict
+            comment: Comment 'data' dict from a JSON API comment listing
 
         Returns:
             Normalized comment data dictionary or None if invalid
         """
-        try:
-            get = lambda k, d=None: self._get_attr(comment, k, d)
+        g = comment.get
 
-            # For PRAW objects, check if body attribute exists
-            if not isinstance(comment, dict) and not hasattr(comment, 'body'):
-                return None
+        body = g('body', '')
+        if not body or body in ('[deleted]', '[removed]'):
+            return None
 
-            body = get('body', '')
-            if not body or body in ('[deleted]', '[removed]'):
-                return None
+        return {
+            'id': g('id', ''),
+            'author': g('author') or '[deleted]',
+            'body': _clip(body, MAX_COMMENT_BODY_LENGTH),
+            'score': g('score', 0),
+            'created_utc': g('created_utc', 0),
+        }
 
-            author = get('author')
-            author_str = str(author) if author else '[deleted]'
+    def _wait_for_praw_rate_limit(self) -> None:
+        """
+        Sleep only when Reddit's advertised rate-limit budget is nearly spent.
 
-            return {
-                'id': get('id', ''),
-                'author': author_str,
-                'body': body[:MAX_COMMENT_BODY_LENGTH],
-                'score': get('score', 0),
-                'created_utc': get('created_utc', 0),
-            }
-        except AttributeError:
-            return None
+        Reads the x-ratelimit-remaining / x-ratelimit-reset values PRAW
+        records from the last response. prawcore 2.x exposes the reset time,
+        and the remaining requests are spread over the time left; prawcore
+        3+ exposes only its own next-request deadline, which is waited out.
+        """
+        limiter = getattr(getattr(self.reddit, '_core', None), '_rate_limiter', None)
+        remaining = getattr(limiter, 'remaining', None)
+        if remaining is None or remaining >= PRAW_RATE_LIMIT_THRESHOLD:
+            return
+
+        reset_timestamp = getattr(limiter, 'reset_timestamp', None)
+        next_request_ns = getattr(limiter, 'next_request_timestamp_ns', None)
+        if reset_timestamp is not None:
+            wait = max(0.0, reset_timestamp - time.time()) / max(remaining, 1)
+        elif next_request_ns is not None:
+            # prawcore 3+ schedules requests on the monotonic clock
+            wait = max(0.0, (next_request_ns - time.monotonic_ns()) / 1e9)
+        else:
+            print("Warning: PRAW rate limiter exposes no reset time; not pacing",
+                  file=sys.stderr)
+            return
+        time.sleep(wait)
 
     def fetch_subreddit_posts_authenticated(
         self,
         subreddit_name: str,
         start: datetime,
         end: datetime
-    ) -> List[Dict]:
+    ) -> List[Post]:
         """
         Fetch posts from a subreddit using authenticated PRAW.
 
@@ -232,14 +591,21 @@ class RedditFetcher:
             end: End datetime (UTC)
 
         Returns:
-            List of post dictionaries
+            List of Post objects
+
+        Raises:
+            IncompleteFetchError: If a listing or any comment fetch failed;
+                carries the posts fetched so far
         """
         posts = []
         subreddit = self.reddit.subreddit(subreddit_name)
+        error = None
 
         try:
             # Fetch recent posts (new + hot + top for better coverage)
-            seen_ids = set()
+            start_ts, end_ts = start.timestamp(), end.timestamp()
+            seen_ids: Set[str] = set()
+            candidates = []
 
             for listing in ['new', 'hot', 'top']:
                 if listing == 'top':
@@ -255,116 +621,503 @@ class RedditFetcher:
                         continue
                     seen_ids.add(post.id)
 
+                    # Read fields loaded from the listing directly; attribute
+                    # access on a Submission can trigger a lazy fetch
+                    attrs = post.__dict__
+
                     # Check time window
-                    if not self._is_within_time_window(post.created_utc, start, end):
+                    created = attrs.get('created_utc', 0)
+                    if not self._is_within_time_window(created, start_ts, end_ts):
                         continue
 
                     # Check minimum score
-                    if post.score < self.min_score:
+                    if attrs.get('score', 0) < self.min_score:
                         continue
 
-                    post_data = self._extract_post_data(post, subreddit_name)
-
-                    # Fetch top comments
-                    try:
-                        post.comments.replace_more(limit=0)  # Skip "load more"
-                        comments = []
-                        for comment in post.comments[:self.max_comments]:
-                            comment_data = self._extract_comment_data(comment)
-                            if comment_data:
-                                comments.append(comment_data)
-                        post_data['comments'] = comments
-                    except Exception as e:
-                        print(f"  Warning: Could not fetch comments for {post.id}: {e}",
-                              file=sys.stderr)
+                    candidates.append(post)
+
+                    if len(candidates) >= self.max_posts:
+                        break
 
+            # Fetch comment listings concurrently from the JSON API, which
+            # avoids hydrating PRAW comment forests
+            max_workers = max(1, min(COMMENT_FETCH_WORKERS, len(candidates)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                all_comments = executor.map(
+                    self._fetch_comments, [post.id for post in candidates]
+                )
+                for post, comments in zip(candidates, all_comments):
+                    post_data = self._extract_post_data_praw(post, subreddit_name)
+                    if comments is None:
+                        error = f"comments missing for {post.id}"
+                    else:
+                        post_data.comments = comments
                     posts.append(post_data)
 
-                    # Rate limiting
-                    time.sleep(self.rate_limit_delay)
+        except Exception as e:
+            print(f"Error fetching from r/{subreddit_name}: {e}", file=sys.stderr)
+            error = str(e)
+
+        if error:
+            raise IncompleteFetchError(f"r/{subreddit_name}: {error}", posts)
+        return posts
+
+    def _praw_access_token(self) -> Optional[str]:
+        """
+        Return a valid OAuth access token from PRAW's authorizer, if any.
+
+        An expired token is refreshed through the authorizer first, under a
+        lock so concurrent comment workers trigger only one refresh.
+
+        Returns:
+            Bearer token string, or None when unauthenticated or the token
+            cannot be refreshed
+        """
+        authorizer = getattr(getattr(self.reddit, '_core', None), '_authorizer', None)
+        if authorizer is None:
+            return None
+        with self._token_lock:
+            try:
+                if not authorizer.is_valid():
+                    authorizer.refresh()
+            except (PrawcoreException, AttributeError) as e:
+                print(f"  Warning: Could not refresh OAuth token: {e}", file=sys.stderr)
+                return None
+            return authorizer.access_token
+
+    def _fetch_comments(self, post_id: str) -> Optional[List[Dict]]:
+        """
+        Fetch and normalize the top-level comments of a post via the JSON API.
+
+        Args:
+            post_id: Reddit post ID (without the t3_ prefix)
+
+        Returns:
+            List of comment dictionaries, or None if the fetch failed
+        """
+        comments = []
+        try:
+            params = {
+                'limit': self.max_comments, 'depth': 1, 'sort': 'top', 'raw_json': 1
+            }
+            headers = {}
+            token = self._praw_access_token()
+            if token:
+                # Reuse PRAW's OAuth token so the request counts against the
+                # authenticated budget rather than the public one
+                url = f"{REDDIT_OAUTH_URL}/comments/{post_id}.json"
+                headers['Authorization'] = f'bearer {token}'
+            else:
+                url = f"https://www.reddit.com/comments/{post_id}.json"
+            response = self._http_get(url, params, headers=headers)
+            if token and response.status_code == 401:
+                # Token revoked or expired mid-flight; the public endpoint
+                # still serves comments without it
+                response.close()
+                url = f"https://www.reddit.com/comments/{post_id}.json"
+                response = self._http_get(url, params)
+            with response:
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+
+            # Response is [post listing, comment listing]; drop "more" stubs
+            children = [
+                child.get('data', {})
+                for child in data[1].get('data', {}).get('children', [])
+                if child.get('kind') == 't1'
+            ]
+            for child in children:
+                comment_data = self._extract_comment_data_dict(child)
+                if comment_data:
+                    comments.append(comment_data)
+                if len(comments) >= self.max_comments:
+                    break
+        except (requests.RequestException, orjson.JSONDecodeError,
+                IndexError, KeyError, TypeError, AttributeError) as e:
+            # The last four cover unexpected payload shapes (e.g. an error
+            # object instead of the [post, comments] pair)
+            print(f"  Warning: Could not fetch comments for {post_id}: {e}",
+                  file=sys.stderr)
+            return None
+        return comments
+
+    def _http_get(self, url: str, params: Dict, **kwargs: Any) -> requests.Response:
+        """
+        Issue a GET through the shared session, gated by the shared token bucket.
+
+        All public JSON API requests go through this method so rate-limit
+        accounting lives in one place rather than in per-loop sleeps. A 429
+        drains the bucket and is retried up to HTTP_MAX_RETRIES times; the
+        last response is returned if Reddit is still rate limiting.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            **kwargs: Extra arguments passed to requests.Session.get
+
+        Returns:
+            requests.Response
+        """
+        for attempt in range(HTTP_MAX_RETRIES + 1):
+            self.rate_limiter.acquire()
+            response = self.http.get(url, params=params, timeout=30, **kwargs)
+            self.rate_limiter.observe(response.headers)
+            if response.status_code != 429 or attempt == HTTP_MAX_RETRIES:
+                return response
+
+            # Rate limited; hold off every worker until the window resets,
+            # then retry through the bucket like any other request
+            try:
+                retry_after = float(response.headers.get('Retry-After', ''))
+            except ValueError:
+                retry_after = self.rate_limit_delay * self.rate_limit_burst
+            self.rate_limiter.penalize(retry_after)
+            response.close()
+        return response
+
+    def fetch_subreddit_posts_pushshift(
+        self,
+        subreddit_name: str,
+        start: datetime,
+        end: datetime
+    ) -> List[Post]:
+        """
+        Fetch posts from a subreddit via a Pushshift-compatible search API.
+
+        The archive filters by creation time server-side, so only posts inside
+        the window are transferred. Pages are walked backwards from the window
+        end; each next 'before' cursor is one second past the oldest
+        created_utc seen, so posts sharing that second are not skipped.
+        Archived posts carry no comments, and their scores are captured near
+        submission time, so min_score is not applied to them.
+
+        Args:
+            subreddit_name: Name of subreddit (without r/)
+            start: Start datetime (UTC)
+            end: End datetime (UTC)
+
+        Returns:
+            List of Post objects
+
+        Raises:
+            IncompleteFetchError: If a search request failed; carries the
+                posts fetched so far (empty if the archive is unavailable)
+        """
+        posts = []
+        seen_ids: Set[str] = set()
+        after = int(start.timestamp())
+        before = int(end.timestamp())
+
+        try:
+            while len(posts) < self.max_posts and before > after:
+                params = {
+                    'subreddit': subreddit_name,
+                    'after': after,
+                    'before': before,
+                    'size': PUSHSHIFT_PAGE_SIZE,
+                    'sort': 'desc',
+                    'sort_type': 'created_utc',
+                }
+                with self._http_get(PUSHSHIFT_SEARCH_URL, params) as response:
+                    response.raise_for_status()
+                    page = orjson.loads(response.content).get('data', [])
+
+                new_posts = 0
+                for post in page:
+                    post_id = post.get('id')
+                    if post_id in seen_ids:
+                        continue
+                    seen_ids.add(post_id)
+                    new_posts += 1
+
+                    posts.append(self._extract_post_data_dict(post, subreddit_name))
 
                     if len(posts) >= self.max_posts:
                         break
 
-        except Exception as e:
-            print(f"Error fetching from r/{subreddit_name}: {e}", file=sys.stderr)
+                # A page of only already-seen posts means the cursor is stuck
+                if not new_posts:
+                    break
+
+                # Continue from the oldest post on this page; 'before' is
+                # exclusive, so include its second and let seen_ids dedupe
+                oldest = min(int(p.get('created_utc', before)) for p in page)
+                before = min(oldest + 1, before)
+
+        except (requests.RequestException, orjson.JSONDecodeError,
+                KeyError, TypeError, ValueError, AttributeError) as e:
+            # The last four cover unexpected payload shapes (e.g. "data": null
+            # or a non-numeric created_utc), which should also fall back
+            print(f"Warning: Pushshift search failed for r/{subreddit_name}: {e}",
+                  file=sys.stderr)
+            raise IncompleteFetchError(f"r/{subreddit_name}: {e}", posts) from e
 
         return posts
 
+    def _iter_listing(
+        self,
+        url: str,
+        params: Dict,
+        page: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict]:
+        """
+        Stream the post payloads of a JSON API listing one child at a time.
+
+        The response body is parsed incrementally with ijson, so only the
+        post currently being examined is materialized as a Python dict.
+
+        Args:
+            url: Listing URL
+            params: Query parameters
+            page: Optional dict that receives the listing's 'after' cursor
+                once the response has been read
+
+        Yields:
+            Post data dictionaries (the 'data' of each listing child)
+        """
+        with self._http_get(url, params, stream=True) as response:
+            response.raise_for_status()
+            # Let urllib3 undo any gzip encoding before ijson reads the stream
+            response.raw.decode_content = True
+            builder = None
+            for prefix, event, value in ijson.parse(response.raw, use_float=True):
+                if builder is not None:
+                    if prefix == 'data.children.item' and event == 'end_map':
+                        builder.event(event, value)
+                        yield builder.value.get('data', {})
+                        builder = None
+                    else:
+                        builder.event(event, value)
+                elif prefix == 'data.children.item' and event == 'start_map':
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                elif prefix == 'data.after' and page is not None:
+                    page['after'] = value
+
     def fetch_subreddit_posts_unauthenticated(
         self,
-        subreddit_name: str,
+        subreddit_names: List[str],
         start: datetime,
         end: datetime
-    ) -> List[Dict]:
+    ) -> Dict[str, List[Post]]:
         """
-        Fetch posts from a subreddit using Reddit's public JSON API.
+        Fetch posts from a batch of subreddits using Reddit's public JSON API.
         This is rate-limited but requires no credentials.
 
+        The batch is requested as a single r/a+b+c multireddit listing. Each
+        listing is paged with its 'after' cursor until every subreddit holds
+        max_posts posts, the 'new' listing leaves the time window, or the
+        listing has returned as many posts as max_posts per subreddit would
+        have fetched separately.
+
         Args:
-            subreddit_name: Name of subreddit (without r/)
+            subreddit_names: Names of subreddits (without r/)
             start: Start datetime (UTC)
             end: End datetime (UTC)
 
         Returns:
-            List of post dictionaries
+            Dictionary mapping subreddit names to lists of Post objects
+
+        Raises:
+            IncompleteFetchError: If any listing request failed; carries the
+                posts fetched so far
         """
-        posts = []
-        headers = {
-            'User-Agent': self.reddit_config.get('user_agent', 'AI-Reddit-Digest/1.0')
-        }
+        posts_by_subreddit = defaultdict(list)
+        # Listings report canonical names; map them back to the configured spelling
+        names = {name.lower(): name for name in subreddit_names}
+        multireddit = '+'.join(subreddit_names)
+        start_ts, end_ts = start.timestamp(), end.timestamp()
+        seen_ids: Set[str] = set()
+        listing_budget = self.max_posts * len(subreddit_names)
+
+        def batch_full() -> bool:
+            return all(
+                len(posts_by_subreddit[name]) >= self.max_posts
+                for name in subreddit_names
+            )
 
         try:
             # Fetch from multiple listings for better coverage
             for listing in ['new', 'hot', 'top']:
-                url = f"https://www.reddit.com/r/{subreddit_name}/{listing}.json"
-                params = {'limit': min(REDDIT_API_MAX_LIMIT, self.max_posts)}
+                url = f"https://www.reddit.com/r/{multireddit}/{listing}.json"
+                params = {'raw_json': 1}
                 if listing == 'top':
                     params['t'] = 'week'
 
-                response = requests.get(url, headers=headers, params=params, timeout=30)
-                response.raise_for_status()
+                fetched = 0
+                after = None
+                while fetched < listing_budget and not batch_full():
+                    params['limit'] = min(REDDIT_API_MAX_LIMIT, listing_budget - fetched)
+                    if after:
+                        params['after'] = after
+                    page: Dict[str, Any] = {}
+                    past_window = False
+
+                    for post in self._iter_listing(url, params, page):
+                        fetched += 1
+
+                        # Skip duplicates; a post rejected once is rejected again,
+                        # so mark it seen before filtering
+                        post_id = post.get('id')
+                        if post_id in seen_ids:
+                            continue
+                        seen_ids.add(post_id)
+
+                        # Check time window; 'new' is newest first, so once
+                        # it passes the window start no later page can match
+                        created = post.get('created_utc', 0)
+                        if listing == 'new' and created < start_ts:
+                            past_window = True
+                        if not self._is_within_time_window(created, start_ts, end_ts):
+                            continue
+
+                        # Check minimum score
+                        if post.get('score', 0) < self.min_score:
+                            continue
+
+                        # Enforce max_posts per subreddit, not per batch
+                        subreddit = post.get('subreddit', '')
+                        subreddit_name = names.get(subreddit.lower(), subreddit)
+                        posts = posts_by_subreddit[subreddit_name]
+                        if len(posts) >= self.max_posts:
+                            continue
+
+                        # For unauthenticated mode, skip deep comment fetching
+                        # to avoid rate limits; comments stay empty.
+                        post_data = self._extract_post_data_dict(post, subreddit_name)
+
+                        posts.append(post_data)
+
+                    after = page.get('after')
+                    if past_window or not after:
+                        break
 
-                data = response.json()
-                children = data.get('data', {}).get('children', [])
+        # ijson reads response.raw directly, so stream errors (dropped
+        # connections, read timeouts, bad gzip) surface as urllib3 errors
+        except (requests.RequestException, Urllib3HTTPError, ijson.JSONError) as e:
+            print(f"Error fetching from r/{multireddit}: {e}", file=sys.stderr)
+            raise IncompleteFetchError(f"r/{multireddit}: {e}", posts_by_subreddit) from e
 
-                seen_ids = {p['id'] for p in posts}
+        return posts_by_subreddit
 
-                for child in children:
-                    post = child.get('data', {})
+    def _fetch_one(
+        self,
+        batch: List[str],
+        start: datetime,
+        end: datetime
+    ) -> Dict[str, List[Post]]:
+        """
+        Fetch one unit of work using the active mode.
 
-                    # Skip duplicates
-                    if post.get('id') in seen_ids:
-                        continue
+        Authenticated mode fetches each subreddit through PRAW; unauthenticated
+        mode fetches the whole batch with a single multireddit request per listing.
+        With use_pushshift enabled, each subreddit is first tried against the
+        Pushshift-compatible archive, and only kept from it if the archive
+        returned a full max_posts posts.
 
-                    # Check time window
-                    created = post.get('created_utc', 0)
-                    if not self._is_within_time_window(created, start, end):
-                        continue
+        Args:
+            batch: Subreddit names to fetch
+            start: Start datetime (UTC)
+            end: End datetime (UTC)
 
-                    # Check minimum score
-                    if post.get('score', 0) < self.min_score:
-                        continue
+        Returns:
+            Dictionary mapping subreddit names to lists of Post objects
+        """
+        posts_by_subreddit = {}
+
+        # Prefer the archive's time-windowed search; subreddits it cannot
+        # fill to max_posts fall through to the Reddit API below
+        if self.use_pushshift:
+            for subreddit in batch:
+                posts = self._cached(
+                    ('pushshift', subreddit), start, end,
+                    lambda: self.fetch_subreddit_posts_pushshift(subreddit, start, end)
+                )
+                if len(posts) >= self.max_posts:
+                    posts_by_subreddit[subreddit] = posts
+            batch = [s for s in batch if s not in posts_by_subreddit]
+            if not batch:
+                return posts_by_subreddit
+
+        if not self.use_authenticated:
+            posts_by_subreddit.update(self._cached(
+                ('unauthenticated', tuple(batch)), start, end,
+                lambda: self.fetch_subreddit_posts_unauthenticated(batch, start, end)
+            ))
+            return posts_by_subreddit
+
+        for subreddit in batch:
+            posts_by_subreddit[subreddit] = self._cached(
+                ('authenticated', subreddit), start, end,
+                lambda: self._fetch_authenticated_paced(subreddit, start, end)
+            )
+        return posts_by_subreddit
 
-                    post_data = self._extract_post_data(post, subreddit_name)
+    def _fetch_authenticated_paced(
+        self,
+        subreddit: str,
+        start: datetime,
+        end: datetime
+    ) -> List[Post]:
+        """
+        Fetch a subreddit through PRAW, pausing first if the budget is nearly spent.
 
-                    # For unauthenticated mode, skip deep comment fetching
-                    # to avoid rate limits. Include basic comment info if available.
-                    post_data['comments'] = []
+        Args:
+            subreddit: Name of subreddit (without r/)
+            start: Start datetime (UTC)
+            end: End datetime (UTC)
 
-                    posts.append(post_data)
-                    seen_ids.add(post['id'])
+        Returns:
+            List of Post objects
+        """
+        self._wait_for_praw_rate_limit()
+        return self.fetch_subreddit_posts_authenticated(subreddit, start, end)
 
-                    if len(posts) >= self.max_posts:
-                        break
+    def _cached(
+        self,
+        key: tuple,
+        start: datetime,
+        end: datetime,
+        fetch: Callable[[], Any]
+    ) -> Any:
+        """
+        Return a cached fetch result, or run the fetch and cache its result.
 
-                # Rate limiting between API calls
-                time.sleep(self.rate_limit_delay)
+        Keys include the time window rounded to the hour and the fetch
+        settings that shape the result, so a changed window or config
+        misses the cache. A fetch that raises IncompleteFetchError yields
+        its partial result uncached, so the next run retries it; empty
+        results are not cached either.
 
-        except requests.RequestException as e:
-            print(f"Error fetching from r/{subreddit_name}: {e}", file=sys.stderr)
+        Args:
+            key: Mode and subreddit(s) identifying the fetch
+            start: Start datetime (UTC)
+            end: End datetime (UTC)
+            fetch: Zero-argument callable performing the fetch
 
-        return posts
+        Returns:
+            The fetch result, possibly partial
+        """
+        if self.cache is None:
+            try:
+                return fetch()
+            except IncompleteFetchError as e:
+                return e.partial
+
+        cache_key = key + (
+            int(start.timestamp() // CACHE_TIME_BUCKET_SECONDS),
+            int(end.timestamp() // CACHE_TIME_BUCKET_SECONDS),
+            self.max_posts, self.max_comments, self.min_score
+        )
+        result = self.cache.get(cache_key)
+        if result is None:
+            try:
+                result = fetch()
+            except IncompleteFetchError as e:
+                return e.partial
+            if result:
+                self.cache.set(cache_key, result, expire=self.cache_ttl)
+        return result
 
     def fetch_all(
         self,
@@ -391,23 +1144,50 @@ class RedditFetcher:
               file=sys.stderr)
         print("-" * 50, file=sys.stderr)
 
-        for i, subreddit in enumerate(subreddits, 1):
-            print(f"[{i}/{len(subreddits)}] Fetching r/{subreddit}...", file=sys.stderr)
-
-            if self.use_authenticated:
-                posts = self.fetch_subreddit_posts_authenticated(subreddit, start, end)
-            else:
-                posts = self.fetch_subreddit_posts_unauthenticated(subreddit, start, end)
-
-            print(f"  Found {len(posts)} posts", file=sys.stderr)
-            all_posts.extend(posts)
-
-            # Additional rate limiting between subreddits
-            if i < len(subreddits):
-                time.sleep(self.rate_limit_delay)
-
-        # Sort by score (descending) for easier processing
-        all_posts.sort(key=lambda x: x['score'], reverse=True)
+        # Overlap network I/O across subreddit batches in unauthenticated
+        # mode; rate limiting is enforced per request. PRAW is not
+        # thread-safe, so authenticated mode walks subreddits on a single
+        # worker and gets its concurrency from the per-post comment fetches.
+        if self.use_authenticated:
+            batches = _chunk(subreddits, 1)
+            max_workers = 1
+        else:
+            batches = _chunk(subreddits, SUBREDDIT_BATCH_SIZE, MAX_MULTIREDDIT_LENGTH)
+            max_workers = max(1, min(self.max_concurrency, len(batches)))
+        posts_by_subreddit = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._fetch_one, batch, start, end): batch
+                for batch in batches
+            }
+            done = 0
+            for future in as_completed(futures):
+                try:
+                    batch_posts = future.result()
+                except Exception as e:
+                    # One failed batch must not discard the others
+                    batch_name = '+'.join(futures[future])
+                    print(f"Error fetching from r/{batch_name}: {e}", file=sys.stderr)
+                    batch_posts = {}
+                for subreddit in futures[future]:
+                    done += 1
+                    posts = batch_posts.get(subreddit, [])
+                    print(f"[{done}/{len(subreddits)}] r/{subreddit}: Found {len(posts)} posts",
+                          file=sys.stderr)
+                posts_by_subreddit.update(batch_posts)
+
+        # Merge in configured order so results do not depend on completion order
+        for subreddit in subreddits:
+            all_posts.extend(posts_by_subreddit.get(subreddit, []))
+
+        # Sort by score (descending) for easier processing; when only the
+        # top-K posts are kept, a bounded heap avoids sorting everything
+        if 0 < self.max_total_posts < len(all_posts):
+            all_posts = heapq.nlargest(
+                self.max_total_posts, all_posts, key=attrgetter('score')
+            )
+        else:
+            all_posts.sort(key=attrgetter('score'), reverse=True)
 
         print("-" * 50, file=sys.stderr)
         print(f"Total: {len(all_posts)} posts fetched", file=sys.stderr)
@@ -425,6 +1205,45 @@ class RedditFetcher:
         }
 
 
+def _write_raw_posts_stream(data: Dict, f: Any) -> None:
+    """
+    Write fetched data to a binary stream, one post per line.
+
+    Args:
+        data: Dictionary with 'metadata' and 'posts' from fetch_all()
+        f: Writable binary stream
+    """
+    f.write(b'{"metadata":')
+    f.write(orjson.dumps(data['metadata']))
+    f.write(b',"posts":[')
+    for i, post in enumerate(data['posts']):
+        f.write(b',\n' if i else b'\n')
+        f.write(orjson.dumps(post))
+    f.write(b'\n]}\n')
+
+
+def write_raw_posts(data: Dict, output_path: Path, compress: bool = False) -> None:
+    """
+    Write fetched data as JSON, streaming one post at a time.
+
+    Each post is serialized with orjson and written on its own line, so the
+    full document is never materialized as a single string in memory.
+
+    Args:
+        data: Dictionary with 'metadata' and 'posts' from fetch_all()
+        output_path: Destination file path
+        compress: Compress the output with zstandard
+    """
+    with open(output_path, 'wb') as f:
+        if compress:
+            import zstandard
+            compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+            with compressor.stream_writer(f, closefd=False) as writer:
+                _write_raw_posts_stream(data, writer)
+        else:
+            _write_raw_posts_stream(data, f)
+
+
 def main():
     """
     CLI interface for fetching Reddit content.
@@ -472,9 +1291,23 @@ def main():
         type=int,
         default=None
     )
+    arg_parser.add_argument(
+        '--compress', '-z',
+        help='Write zstandard-compressed output (raw_posts.json.zst)',
+        action='store_true'
+    )
 
     args = arg_parser.parse_args()
 
+    # zstandard is optional; fail before fetching rather than after
+    if args.compress:
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            print("Error: --compress requires zstandard "
+                  "(pip install -r requirements-compress.txt)", file=sys.stderr)
+            sys.exit(1)
+
     # Load config
     config = load_config(args.config)
 
@@ -509,13 +1342,14 @@ def main():
         output_path = Path(args.output_dir) / 'raw_posts.json'
     else:
         output_path = Path(args.output)
+    if args.compress:
+        output_path = output_path.with_name(output_path.name + '.zst')
 
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Write output
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    write_raw_posts(data, output_path, compress=args.compress)
 
     print(f"\nOutput written to: {output_path}", file=sys.stderr)
 
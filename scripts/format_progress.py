@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
 """Format Claude CLI stream-json output into clean progress messages with spinner."""
 
-import json
+import functools
 import sys
 import threading
 import time
 
+import orjson
+
 # Spinner characters
 SPINNER = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
+SPINNER_BYTES = [char.encode() for char in SPINNER]
+
+# Carriage return + ANSI clear-line, written before each spinner frame
+CLEAR_LINE_PREFIX = b'\r\033[K  '
 
 # Timing constants
 SPINNER_DELAY_SECONDS = 0.1
@@ -17,9 +23,20 @@ THREAD_JOIN_TIMEOUT_SECONDS = 0.2
 TEXT_LENGTH_THRESHOLD = 50
 
 
+@functools.lru_cache(maxsize=512)
 def shorten_path(path: str) -> str:
     """Extract filename from a path for display."""
-    return path.split('/')[-1] if '/' in path else path
+    return path.rpartition('/')[2] or path
+
+
+# Spinner message builders keyed by tool name
+TOOL_HANDLERS = {
+    "Read": lambda i: f"Reading {shorten_path(i.get('file_path', ''))}",
+    "Write": lambda i: f"Writing {shorten_path(i.get('file_path', ''))}",
+    "Glob": lambda i: f"Searching {i.get('pattern', '')}",
+    "Grep": lambda i: f"Grep {i.get('pattern', '')}",
+    "Edit": lambda i: f"Editing {shorten_path(i.get('file_path', ''))}",
+}
 
 
 class Spinner:
@@ -29,13 +46,24 @@ class Spinner:
         self.message = "Working..."
         self.idx = 0
 
+    @property
+    def message(self) -> str:
+        return self._message
+
+    @message.setter
+    def message(self, message: str) -> None:
+        # Encode once per update rather than on every spinner tick
+        self._message = message
+        self._message_bytes = b' ' + message.encode()
+
     def _spin(self):
+        out = sys.stdout.buffer
+        n = len(SPINNER_BYTES)
         while self.running:
-            char = SPINNER[self.idx % len(SPINNER)]
             # Clear line with ANSI escape code, then write new content
-            sys.stdout.write(f'\r\033[K  {char} {self.message}')
-            sys.stdout.flush()
-            self.idx += 1
+            out.write(CLEAR_LINE_PREFIX + SPINNER_BYTES[self.idx] + self._message_bytes)
+            out.flush()
+            self.idx = (self.idx + 1) % n
             time.sleep(SPINNER_DELAY_SECONDS)
 
     def start(self, message="Working..."):
@@ -69,14 +97,15 @@ def format_progress() -> int:
     exit_code = 0
 
     try:
-        for line in sys.stdin:
+        # Read raw bytes; orjson parses them without a text-decoding pass
+        for line in sys.stdin.buffer:
             line = line.strip()
             if not line:
                 continue
 
             try:
-                event = json.loads(line)
-            except json.JSONDecodeError:
+                event = orjson.loads(line)
+            except orjson.JSONDecodeError:
                 continue
 
             event_type = event.get("type")
@@ -90,21 +119,9 @@ def format_progress() -> int:
                             tool_name = block.get("name", "")
                             tool_input = block.get("input", {})
 
-                            if tool_name == "Read":
-                                path = tool_input.get("file_path", "")
-                                spinner.update(f"Reading {shorten_path(path)}")
-                            elif tool_name == "Write":
-                                path = tool_input.get("file_path", "")
-                                spinner.update(f"Writing {shorten_path(path)}")
-                            elif tool_name == "Glob":
-                                pattern = tool_input.get("pattern", "")
-                                spinner.update(f"Searching {pattern}")
-                            elif tool_name == "Grep":
-                                pattern = tool_input.get("pattern", "")
-                                spinner.update(f"Grep {pattern}")
-                            elif tool_name == "Edit":
-                                path = tool_input.get("file_path", "")
-                                spinner.update(f"Editing {shorten_path(path)}")
+                            handler = TOOL_HANDLERS.get(tool_name)
+                            if handler:
+                                spinner.update(handler(tool_input))
                         elif block.get("type") == "text":
                             # Show that Claude is thinking/writing
                             text = block.get("text", "")
@@ -14,26 +14,62 @@ Usage:
 """
 
 import argparse
+import functools
+import os
+import pickle
 import sys
 from datetime import datetime, timedelta, timezone
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 
-import yaml
-from dateutil import parser as date_parser
-from dateutil.tz import tzutc
+# Bound once so hot paths do a single global lookup
+_UTC = timezone.utc
 
 # Time window defaults and limits
 DEFAULT_DAYS = 7
 CLOCK_SKEW_BUFFER_HOURS = 1
 LARGE_WINDOW_WARNING_DAYS = 90
 
+# Precomputed limits for validate_time_window
+_CLOCK_SKEW_BUFFER_SECONDS = CLOCK_SKEW_BUFFER_HOURS * 3600
+_LARGE_DELTA = timedelta(days=LARGE_WINDOW_WARNING_DAYS + 1)
 
+# In-process config cache: (path, mtime_ns, size) -> pickled config. Stored
+# pickled so every caller gets its own copy to mutate.
+_CONFIG_MEMO: Dict[Tuple[str, int, int], bytes] = {}
+
+
+def _parse_canonical(timestamp_str: str) -> Optional[datetime]:
+    """
+    Parse the exact YYYY-MM-DDTHH:MM:SSZ shape emitted by format_timestamp_iso.
+
+    Args:
+        timestamp_str: Timestamp string
+
+    Returns:
+        UTC datetime, or None if the string is not in the canonical shape
+    """
+    s = timestamp_str
+    if (len(s) != 20 or s[19] != 'Z' or s[4] != '-' or s[7] != '-'
+            or s[10] != 'T' or s[13] != ':' or s[16] != ':'):
+        return None
+    fields = (s[0:4], s[5:7], s[8:10], s[11:13], s[14:16], s[17:19])
+    # int() also accepts signs, underscores, spaces and non-ASCII digits
+    if not all(f.isascii() and f.isdigit() for f in fields):
+        return None
+    try:
+        return datetime(*map(int, fields), tzinfo=_UTC)
+    except ValueError:
+        return None
+
+
+# Parsed results are immutable datetimes, so repeated strings can be memoized
+@functools.lru_cache(maxsize=256)
 def parse_iso_timestamp(timestamp_str: str) -> datetime:
     """
     Parse an ISO-8601 formatted timestamp string into a UTC datetime.
 
     Handles various ISO formats:
-    - 2025-01-01T00:00:00Z
+    - 2025-01-01T00:00:00Z (canonical form, parsed without a general parser)
     - 2025-01-01T00:00:00+00:00
     - 2025-01-01 (assumes midnight UTC)
 
@@ -47,38 +83,56 @@ def parse_iso_timestamp(timestamp_str: str) -> datetime:
         ValueError: If the timestamp cannot be parsed
     """
     try:
-        dt = date_parser.parse(timestamp_str)
+        dt = _parse_canonical(timestamp_str)
+        if dt is not None:
+            return dt
+        # Fast path for strict ISO-8601; fall back to dateutil for anything else
+        try:
+            dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+        except ValueError:
+            # dateutil is slow to import, so load it only when needed
+            from dateutil import parser as date_parser
+            dt = date_parser.parse(timestamp_str)
         # If no timezone info, assume UTC
         if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
+            dt = dt.replace(tzinfo=_UTC)
         # Convert to UTC
-        return dt.astimezone(timezone.utc)
+        return dt.astimezone(_UTC)
     except Exception as e:
         raise ValueError(f"Cannot parse timestamp '{timestamp_str}': {e}")
 
 
-def get_default_time_window(days: int = DEFAULT_DAYS) -> Tuple[datetime, datetime]:
+def get_default_time_window(
+    days: int = DEFAULT_DAYS,
+    now: Optional[datetime] = None
+) -> Tuple[datetime, datetime]:
     """
     Get the default time window: last N days ending now.
 
     Args:
         days: Number of days to look back (default: 7)
+        now: Current UTC time (default: read the clock)
 
     Returns:
         Tuple of (start_datetime, end_datetime) in UTC
     """
-    end = datetime.now(timezone.utc)
+    end = now or datetime.now(_UTC)
     start = end - timedelta(days=days)
     return start, end
 
 
-def validate_time_window(start: datetime, end: datetime) -> None:
+def validate_time_window(
+    start: datetime,
+    end: datetime,
+    now: Optional[datetime] = None
+) -> None:
     """
     Validate that a time window is sensible.
 
     Args:
         start: Start datetime
         end: End datetime
+        now: Current UTC time (default: read the clock)
 
     Raises:
         ValueError: If the time window is invalid
@@ -86,14 +140,14 @@ def validate_time_window(start: datetime, end: datetime) -> None:
     if start >= end:
         raise ValueError(f"Start time ({start}) must be before end time ({end})")
 
-    now = datetime.now(timezone.utc)
-    if end > now + timedelta(hours=CLOCK_SKEW_BUFFER_HOURS):
+    now = now or datetime.now(_UTC)
+    if (end - now).total_seconds() > _CLOCK_SKEW_BUFFER_SECONDS:
         raise ValueError(f"End time ({end}) cannot be in the future")
 
-    # Warn if window is very large
-    window_days = (end - start).days
-    if window_days > LARGE_WINDOW_WARNING_DAYS:
-        print(f"Warning: Large time window ({window_days} days). This may take a while.",
+    # Warn if window is very large (more than LARGE_WINDOW_WARNING_DAYS whole days)
+    delta = end - start
+    if delta >= _LARGE_DELTA:
+        print(f"Warning: Large time window ({delta.days} days). This may take a while.",
               file=sys.stderr)
 
 
@@ -119,6 +173,8 @@ def get_time_window(
         Tuple of (start_datetime, end_datetime) in UTC
     """
     config = config or {}
+    # Read the clock once so defaults and validation agree on "now"
+    now = datetime.now(_UTC)
     time_config = config.get('time_window', {})
     default_days = time_config.get('default_days', DEFAULT_DAYS)
 
@@ -139,16 +195,16 @@ def get_time_window(
     # Apply defaults if needed
     if start is None and end is None:
         # Both missing: use default window
-        start, end = get_default_time_window(default_days)
+        start, end = get_default_time_window(default_days, now)
     elif start is None:
         # Only end provided: go back default_days from end
         start = end - timedelta(days=default_days)
     elif end is None:
         # Only start provided: go forward default_days from start (or to now)
-        end = min(start + timedelta(days=default_days), datetime.now(timezone.utc))
+        end = min(start + timedelta(days=default_days), now)
 
     # Validate
-    validate_time_window(start, end)
+    validate_time_window(start, end, now)
 
     return start, end
 
@@ -163,7 +219,7 @@ def format_timestamp(dt: datetime) -> str:
     Returns:
         Formatted string like "2025-01-01 00:00 UTC"
     """
-    return dt.strftime("%Y-%m-%d %H:%M UTC")
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d} UTC"
 
 
 def format_timestamp_iso(dt: datetime) -> str:
@@ -176,7 +232,8 @@ def format_timestamp_iso(dt: datetime) -> str:
     Returns:
         ISO-8601 formatted string
     """
-    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return (f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+            f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z")
 
 
 def format_date_range(start: datetime, end: datetime) -> str:
@@ -190,13 +247,17 @@ def format_date_range(start: datetime, end: datetime) -> str:
     Returns:
         Formatted string like "2025-01-01 -> 2025-01-08"
     """
-    return f"{start.strftime('%Y-%m-%d')} -> {end.strftime('%Y-%m-%d')}"
+    return (f"{start.year:04d}-{start.month:02d}-{start.day:02d} -> "
+            f"{end.year:04d}-{end.month:02d}-{end.day:02d}")
 
 
 def load_config(config_path: str = "config.yaml") -> dict:
     """
     Load configuration from YAML file.
 
+    Repeated loads of an unchanged file (same mtime and size) within one
+    process are served from memory.
+
     Args:
         config_path: Path to config file
 
@@ -204,21 +265,35 @@ def load_config(config_path: str = "config.yaml") -> dict:
         Configuration dictionary
     """
     try:
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f) or {}
+        st = os.stat(config_path)
     except FileNotFoundError:
         print(f"Warning: Config file not found at {config_path}, using defaults",
               file=sys.stderr)
         return {}
 
+    memo_key = (os.fspath(config_path), st.st_mtime_ns, st.st_size)
+    payload = _CONFIG_MEMO.get(memo_key)
+    if payload is not None:
+        return pickle.loads(payload)
 
-def main():
+    # Imported lazily: only needed when the memo misses
+    import yaml
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    # Binary mode: the loader detects the encoding and decodes UTF-8 itself
+    with open(config_path, 'rb') as f:
+        config = yaml.load(f, Loader=loader) or {}
+    _CONFIG_MEMO[memo_key] = pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
+    return config
+
+
+@functools.lru_cache(maxsize=None)
+def _build_arg_parser() -> argparse.ArgumentParser:
     """
-    CLI interface for testing time window parsing.
+    Build the CLI argument parser (constructed once per process).
 
-    Usage:
-        python parse_time_window.py --start 2025-01-01T00:00:00Z --end 2025-01-08T00:00:00Z
-        python parse_time_window.py  # Uses defaults from config
+    Returns:
+        Configured argparse.ArgumentParser
     """
     arg_parser = argparse.ArgumentParser(
         description="Parse and validate time windows for AI Reddit Digest"
@@ -238,8 +313,18 @@ def main():
         help='Path to config file',
         default='config.yaml'
     )
+    return arg_parser
 
-    args = arg_parser.parse_args()
+
+def main():
+    """
+    CLI interface for testing time window parsing.
+
+    Usage:
+        python parse_time_window.py --start 2025-01-01T00:00:00Z --end 2025-01-08T00:00:00Z
+        python parse_time_window.py  # Uses defaults from config
+    """
+    args = _build_arg_parser().parse_args()
 
     # Load config
     config = load_config(args.config)
@@ -20,19 +20,28 @@ Claude will refine these scores based on novelty and personal relevance.
 
 Usage:
     python preprocess.py --input output/raw_posts.json --output output/processed_posts.json
+    python preprocess.py --input output/raw_posts.json.zst  # zstd-compressed input
 """
 
 import argparse
-import json
 import math
 import sys
+from bisect import bisect_right
+from collections import defaultdict
+from heapq import heappush, heapreplace, nlargest
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List, NamedTuple, Optional
 from statistics import median
 
+import orjson
 import yaml
 
+try:
+    import numpy as np
+except ImportError:  # Optional: the scalar scoring path is used instead
+    np = None
+
 # Scoring formula constants
 ENGAGEMENT_SCORE_DIVISOR = 2
 COMMENTS_SCORE_DIVISOR = 3
@@ -51,13 +60,104 @@ CONTENT_SCORE_GOOD = 0.8
 CONTENT_SCORE_SUBSTANTIAL = 1.0
 CONTENT_SCORE_WALL_OF_TEXT = 0.7
 
+# Content score lookup: bucket i covers lengths in [thresholds[i-1], thresholds[i])
+_CONTENT_LENGTH_THRESHOLDS = (
+    CONTENT_LENGTH_VERY_SHORT, CONTENT_LENGTH_BRIEF,
+    CONTENT_LENGTH_GOOD, CONTENT_LENGTH_SUBSTANTIAL
+)
+_CONTENT_SCORES = (
+    CONTENT_SCORE_VERY_SHORT, CONTENT_SCORE_BRIEF, CONTENT_SCORE_GOOD,
+    CONTENT_SCORE_SUBSTANTIAL, CONTENT_SCORE_WALL_OF_TEXT
+)
+
+# Default and fixed scoring weights
+DEFAULT_ENGAGEMENT_WEIGHT = 0.3
+DEFAULT_COMMENTS_WEIGHT = 0.25
+RECENCY_WEIGHT = 0.2  # Fixed, not configurable for simplicity
+CONTENT_WEIGHT = 0.15
+RATIO_WEIGHT = 0.1
+
+# Largest possible contribution of the fixed-weight components
+_MAX_FIXED_COMPONENTS = RECENCY_WEIGHT + CONTENT_WEIGHT * max(_CONTENT_SCORES) + RATIO_WEIGHT
+
+# Score with NumPy arrays instead of per-post Python calls at this many posts
+VECTORIZE_MIN_POSTS = 500
+
 # Formatting limits for Claude
 MAX_SELFTEXT_LENGTH = 500
 MAX_COMMENT_BODY_LENGTH = 300
 MAX_TOP_COMMENTS = 5
 
 
-def compute_engagement_score(score: int, median_score: float) -> float:
+def _parse_iso(timestamp: str) -> datetime:
+    """
+    Parse an ISO-8601 timestamp, including a trailing 'Z'.
+
+    Python 3.11+ parses 'Z' natively; older versions need it rewritten.
+
+    Args:
+        timestamp: ISO-8601 timestamp string
+
+    Returns:
+        Timezone-aware datetime
+    """
+    try:
+        return datetime.fromisoformat(timestamp)
+    except ValueError:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+
+def compute_log_median(median_score: float) -> float:
+    """
+    Compute the engagement normalizer for a subreddit median.
+
+    Constant per subreddit, so computed once rather than once per post.
+
+    Args:
+        median_score: Median score for the subreddit
+
+    Returns:
+        log10(median + 1) plus the engagement divisor
+    """
+    return math.log10(max(median_score, 1) + 1) + ENGAGEMENT_SCORE_DIVISOR
+
+
+class PostView(NamedTuple):
+    """Scoring fields of one post, read by attribute in the scoring loop."""
+    score: int
+    num_comments: int
+    created_utc: float
+    upvote_ratio: float
+    content_length: int
+    subreddit: str
+    idx: int
+
+
+def make_post_views(posts: List[Dict]) -> List[PostView]:
+    """
+    Extract the scoring fields of each post into a PostView.
+
+    Args:
+        posts: List of post dictionaries
+
+    Returns:
+        List of PostView, with idx pointing back into posts
+    """
+    return [
+        PostView(
+            p['score'],
+            p['num_comments'],
+            p['created_utc'],
+            p.get('upvote_ratio', 0.5),
+            len(p.get('selftext') or '') + len(p['title']),
+            p['subreddit'],
+            i
+        )
+        for i, p in enumerate(posts)
+    ]
+
+
+def compute_engagement_score(score: int, log_median: float) -> float:
     """
     Compute normalized engagement score (0-1).
 
@@ -66,7 +166,7 @@ def compute_engagement_score(score: int, median_score: float) -> float:
 
     Args:
         score: Post's Reddit score (upvotes - downvotes)
-        median_score: Median score for the subreddit
+        log_median: Subreddit normalizer from compute_log_median()
 
     Returns:
         Normalized score between 0 and 1
@@ -74,12 +174,9 @@ def compute_engagement_score(score: int, median_score: float) -> float:
     if score <= 0:
         return 0.0
 
-    # Log scale to prevent viral posts from dominating
-    log_score = math.log10(score + 1)
-    log_median = math.log10(max(median_score, 1) + 1)
-
+    # Log scale to prevent viral posts from dominating.
     # Normalize: 1x median = 0.5, 10x median = ~0.75, 100x median = ~1.0
-    normalized = log_score / (log_median + ENGAGEMENT_SCORE_DIVISOR)
+    normalized = math.log10(score + 1) / log_median
     return min(1.0, normalized)
 
 
@@ -103,7 +200,11 @@ def compute_comments_score(num_comments: int) -> float:
     return min(1.0, math.log10(num_comments + 1) / COMMENTS_SCORE_DIVISOR)
 
 
-def compute_recency_score(created_utc: float, start: datetime, end: datetime) -> float:
+def compute_recency_score(
+    created_utc: float,
+    start_ts: float,
+    window_duration: float
+) -> float:
     """
     Compute recency score (0-1).
 
@@ -112,23 +213,19 @@ def compute_recency_score(created_utc: float, start: datetime, end: datetime) ->
 
     Args:
         created_utc: Unix timestamp of post creation
-        start: Time window start
-        end: Time window end
+        start_ts: Time window start as a Unix timestamp
+        window_duration: Time window length in seconds
 
     Returns:
         Score between 0 and 1 (1 = most recent)
     """
-    post_time = datetime.fromtimestamp(created_utc, tz=timezone.utc)
-    window_duration = (end - start).total_seconds()
-
     if window_duration <= 0:
         return 0.5
 
-    time_since_start = (post_time - start).total_seconds()
-    return max(0.0, min(1.0, time_since_start / window_duration))
+    return max(0.0, min(1.0, (created_utc - start_ts) / window_duration))
 
 
-def compute_content_score(selftext: str, title: str) -> float:
+def compute_content_score(total_length: int) -> float:
     """
     Compute content quality score based on length (0-1).
 
@@ -136,24 +233,12 @@ def compute_content_score(selftext: str, title: str) -> float:
     but extremely long posts (walls of text) score slightly lower.
 
     Args:
-        selftext: Post body text
-        title: Post title
+        total_length: Combined length of the post title and body text
 
     Returns:
         Score between 0 and 1
     """
-    total_length = len(selftext) + len(title)
-
-    if total_length < CONTENT_LENGTH_VERY_SHORT:
-        return CONTENT_SCORE_VERY_SHORT
-    elif total_length < CONTENT_LENGTH_BRIEF:
-        return CONTENT_SCORE_BRIEF
-    elif total_length < CONTENT_LENGTH_GOOD:
-        return CONTENT_SCORE_GOOD
-    elif total_length < CONTENT_LENGTH_SUBSTANTIAL:
-        return CONTENT_SCORE_SUBSTANTIAL
-    else:
-        return CONTENT_SCORE_WALL_OF_TEXT
+    return _CONTENT_SCORES[bisect_right(_CONTENT_LENGTH_THRESHOLDS, total_length)]
 
 
 def compute_ratio_score(upvote_ratio: float) -> float:
@@ -173,52 +258,259 @@ def compute_ratio_score(upvote_ratio: float) -> float:
     return max(0.0, (upvote_ratio - 0.5) * 2)
 
 
+def make_heuristic_scorer(weights: Dict) -> Callable[..., Optional[float]]:
+    """
+    Build a heuristic scoring function specialized for one set of weights.
+
+    Weights are resolved from config once and captured by the returned
+    closure, so scoring a post does no config lookups.
+
+    Args:
+        weights: Scoring weights from config
+
+    Returns:
+        Function with the signature of compute_heuristic_score minus weights
+    """
+    # Get weights (use defaults if not specified)
+    w_engagement = weights.get('engagement_weight', DEFAULT_ENGAGEMENT_WEIGHT)
+    w_comments = weights.get('comments_weight', DEFAULT_COMMENTS_WEIGHT)
+    w_recency = RECENCY_WEIGHT
+    w_content = CONTENT_WEIGHT
+    w_ratio = RATIO_WEIGHT
+
+    def score(
+        post: PostView,
+        log_median: float,
+        start_ts: float,
+        window_duration: float,
+        min_score: Optional[float] = None
+    ) -> Optional[float]:
+        engagement = compute_engagement_score(post.score, log_median)
+        comments = compute_comments_score(post.num_comments)
+        partial_score = engagement * w_engagement + comments * w_comments
+
+        # Upper bound: the fixed-weight components are each at most their maximum
+        if min_score is not None:
+            if round(1 + (partial_score + _MAX_FIXED_COMPONENTS) * 9, 2) < min_score:
+                return None
+
+        recency = compute_recency_score(post.created_utc, start_ts, window_duration)
+        content = compute_content_score(post.content_length)
+        ratio = compute_ratio_score(post.upvote_ratio)
+
+        # Weighted sum
+        raw_score = (
+            partial_score +
+            recency * w_recency +
+            content * w_content +
+            ratio * w_ratio
+        )
+
+        # Scale to 1-10
+        return round(1 + raw_score * 9, 2)
+
+    return score
+
+
 def compute_heuristic_score(
-    post: Dict,
-    median_score: float,
+    post: PostView,
+    log_median: float,
+    start_ts: float,
+    window_duration: float,
+    weights: Dict,
+    min_score: Optional[float] = None
+) -> Optional[float]:
+    """
+    Compute the overall heuristic score (1-10) for a post.
+
+    Combines multiple signals with configurable weights. When min_score is
+    given, the engagement and comment components are computed first; if
+    even perfect recency, content and ratio scores could not lift the post
+    above min_score, the remaining components are skipped.
+
+    For scoring many posts, build the function once with
+    make_heuristic_scorer() instead.
+
+    Args:
+        post: Scoring fields of the post
+        log_median: Subreddit normalizer from compute_log_median()
+        start_ts: Time window start as a Unix timestamp
+        window_duration: Time window length in seconds
+        weights: Scoring weights from config
+        min_score: Optional score the post must be able to exceed
+
+    Returns:
+        Score from 1 to 10, or None if it cannot exceed min_score
+    """
+    return make_heuristic_scorer(weights)(
+        post, log_median, start_ts, window_duration, min_score
+    )
+
+
+def _post_arrays(posts: List[Dict], medians: Dict[str, float]) -> tuple:
+    """
+    Extract the scoring inputs of all posts into parallel NumPy arrays.
+
+    Args:
+        posts: List of post dictionaries
+        medians: Median score per subreddit
+
+    Returns:
+        Tuple of (scores, num_comments, created, ratios, lengths, median_scores)
+    """
+    n = len(posts)
+    scores = np.fromiter((p['score'] for p in posts), dtype=np.float64, count=n)
+    num_comments = np.fromiter(
+        (p['num_comments'] for p in posts), dtype=np.float64, count=n
+    )
+    created = np.fromiter((p['created_utc'] for p in posts), dtype=np.float64, count=n)
+    ratios = np.fromiter(
+        (p.get('upvote_ratio', 0.5) for p in posts), dtype=np.float64, count=n
+    )
+    lengths = np.fromiter(
+        (len(p.get('selftext') or '') + len(p['title']) for p in posts),
+        dtype=np.int64, count=n
+    )
+    median_scores = np.fromiter(
+        (medians.get(p['subreddit'], DEFAULT_MEDIAN_SCORE) for p in posts),
+        dtype=np.float64, count=n
+    )
+    return scores, num_comments, created, ratios, lengths, median_scores
+
+
+def score_posts_vectorized(
+    posts: List[Dict],
+    medians: Dict[str, float],
     start: datetime,
     end: datetime,
     weights: Dict
-) -> float:
+) -> List[float]:
     """
-    Compute the overall heuristic score (1-10) for a post.
+    Compute heuristic scores for all posts at once with NumPy.
 
-    Combines multiple signals with configurable weights.
+    Same formula as compute_heuristic_score, evaluated over per-field
+    arrays so the arithmetic runs in C rather than once per post.
 
     Args:
-        post: Post data dictionary
-        median_score: Median score for the subreddit
+        posts: List of post dictionaries
+        medians: Median score per subreddit
         start: Time window start
         end: Time window end
         weights: Scoring weights from config
 
     Returns:
-        Score from 1 to 10
+        List of scores from 1 to 10, in the same order as posts
     """
-    engagement = compute_engagement_score(post['score'], median_score)
-    comments = compute_comments_score(post['num_comments'])
-    recency = compute_recency_score(post['created_utc'], start, end)
-    content = compute_content_score(post.get('selftext', ''), post['title'])
-    ratio = compute_ratio_score(post.get('upvote_ratio', 0.5))
+    n = len(posts)
+    scores, num_comments, created, ratios, lengths, median_scores = _post_arrays(
+        posts, medians
+    )
 
-    # Get weights (use defaults if not specified)
-    w_engagement = weights.get('engagement_weight', 0.3)
-    w_comments = weights.get('comments_weight', 0.25)
-    w_recency = 0.2  # Fixed, not configurable for simplicity
-    w_content = 0.15
-    w_ratio = 0.1
+    # Engagement: log score over log median, zero for non-positive scores
+    engagement = np.log10(np.maximum(scores, 0) + 1) / (
+        np.log10(np.maximum(median_scores, 1) + 1) + ENGAGEMENT_SCORE_DIVISOR
+    )
+    engagement = np.where(scores <= 0, 0.0, np.minimum(engagement, 1.0))
+
+    # Comments: diminishing returns
+    comments = np.minimum(
+        np.log10(np.maximum(num_comments, 0) + 1) / COMMENTS_SCORE_DIVISOR, 1.0
+    )
+
+    # Recency: position within the window
+    window_duration = (end - start).total_seconds()
+    if window_duration <= 0:
+        recency = np.full(n, 0.5)
+    else:
+        recency = np.clip((created - start.timestamp()) / window_duration, 0.0, 1.0)
+
+    # Content: length bucket -> score lookup
+    content = np.array(_CONTENT_SCORES)[np.digitize(lengths, _CONTENT_LENGTH_THRESHOLDS)]
+
+    # Ratio: 50% -> 0, 100% -> 1
+    ratio = np.maximum((ratios - 0.5) * 2, 0.0)
 
-    # Weighted sum
     raw_score = (
-        engagement * w_engagement +
-        comments * w_comments +
-        recency * w_recency +
-        content * w_content +
-        ratio * w_ratio
+        engagement * weights.get('engagement_weight', DEFAULT_ENGAGEMENT_WEIGHT) +
+        comments * weights.get('comments_weight', DEFAULT_COMMENTS_WEIGHT) +
+        recency * RECENCY_WEIGHT +
+        content * CONTENT_WEIGHT +
+        ratio * RATIO_WEIGHT
     )
 
     # Scale to 1-10
-    return round(1 + raw_score * 9, 2)
+    return np.round(1 + raw_score * 9, 2).tolist()
+
+
+def score_posts_jit(
+    posts: List[Dict],
+    medians: Dict[str, float],
+    start: datetime,
+    end: datetime,
+    weights: Dict,
+    parallel: bool = False
+) -> List[float]:
+    """
+    Compute heuristic scores for all posts with the Numba-compiled kernel.
+
+    Fuses every component score into one native loop with no intermediate
+    arrays. Requires numba; raises ImportError when it is not installed.
+
+    Args:
+        posts: List of post dictionaries
+        medians: Median score per subreddit
+        start: Time window start
+        end: Time window end
+        weights: Scoring weights from config
+        parallel: Spread the loop across CPU cores
+
+    Returns:
+        List of scores from 1 to 10, in the same order as posts
+    """
+    from _scoring_numba import score_kernel, score_kernel_parallel
+
+    kernel = score_kernel_parallel if parallel else score_kernel
+    raw_score = kernel(
+        *_post_arrays(posts, medians),
+        start.timestamp(),
+        (end - start).total_seconds(),
+        np.array([
+            weights.get('engagement_weight', DEFAULT_ENGAGEMENT_WEIGHT),
+            weights.get('comments_weight', DEFAULT_COMMENTS_WEIGHT),
+            RECENCY_WEIGHT, CONTENT_WEIGHT, RATIO_WEIGHT
+        ]),
+        np.array(_CONTENT_LENGTH_THRESHOLDS, dtype=np.int64),
+        np.array(_CONTENT_SCORES),
+        float(ENGAGEMENT_SCORE_DIVISOR),
+        float(COMMENTS_SCORE_DIVISOR)
+    )
+
+    # Scale to 1-10
+    return np.round(1 + raw_score * 9, 2).tolist()
+
+
+def _partition_median(scores: List[float]) -> float:
+    """
+    Median of a non-empty list, matching statistics.median's result type.
+
+    NumPy only locates the middle element(s); the value is taken from the
+    original list, so an odd count of ints yields an int and an even count
+    yields the float mean of the two middle values, exactly as in the
+    pure-Python path.
+
+    Args:
+        scores: Non-empty list of scores
+
+    Returns:
+        Median score
+    """
+    n = len(scores)
+    mid = n // 2
+    arr = np.asarray(scores, dtype=np.float64)
+    if n % 2:
+        return scores[int(np.argpartition(arr, mid)[mid])]
+    order = np.argpartition(arr, (mid - 1, mid))
+    return (scores[int(order[mid - 1])] + scores[int(order[mid])]) / 2
 
 
 def compute_subreddit_medians(posts: List[Dict]) -> Dict[str, float]:
@@ -231,13 +523,17 @@ def compute_subreddit_medians(posts: List[Dict]) -> Dict[str, float]:
     Returns:
         Dictionary mapping subreddit names to median scores
     """
-    subreddit_scores = {}
+    subreddit_scores = defaultdict(list)
 
     for post in posts:
-        sr = post['subreddit']
-        if sr not in subreddit_scores:
-            subreddit_scores[sr] = []
-        subreddit_scores[sr].append(post['score'])
+        subreddit_scores[post['subreddit']].append(post['score'])
+
+    if np is not None:
+        # Partition-based median in C instead of a Python-level sort per subreddit
+        return {
+            sr: _partition_median(scores) if scores else DEFAULT_MEDIAN_SCORE
+            for sr, scores in subreddit_scores.items()
+        }
 
     return {
         sr: median(scores) if scores else DEFAULT_MEDIAN_SCORE
@@ -245,38 +541,41 @@ def compute_subreddit_medians(posts: List[Dict]) -> Dict[str, float]:
     }
 
 
-def format_post_for_claude(post: Dict) -> Dict:
+def format_post_for_claude(post: Dict, heuristic_score: float) -> Dict:
     """
     Format a post for efficient Claude processing.
 
     Reduces token count while preserving important information.
 
     Args:
-        post: Post data dictionary with heuristic_score
+        post: Post data dictionary
+        heuristic_score: Score from compute_heuristic_score()
 
     Returns:
         Streamlined post dictionary
     """
     # Truncate long text
-    selftext = post.get('selftext', '')
+    selftext = post.get('selftext') or ''
     if len(selftext) > MAX_SELFTEXT_LENGTH:
         selftext = selftext[:MAX_SELFTEXT_LENGTH] + "..."
 
     # Select top comments by score
-    comments = sorted(
+    comments = nlargest(
+        MAX_TOP_COMMENTS,
         post.get('comments', []),
-        key=lambda c: c.get('score', 0),
-        reverse=True
-    )[:MAX_TOP_COMMENTS]
+        key=lambda c: c.get('score', 0)
+    )
 
-    formatted_comments = [
-        {
+    formatted_comments = []
+    for c in comments:
+        body = c['body']
+        if len(body) > MAX_COMMENT_BODY_LENGTH:
+            body = body[:MAX_COMMENT_BODY_LENGTH] + "..."
+        formatted_comments.append({
             'author': c['author'],
             'score': c['score'],
-            'body': c['body'][:MAX_COMMENT_BODY_LENGTH] + "..." if len(c['body']) > MAX_COMMENT_BODY_LENGTH else c['body']
-        }
-        for c in comments
-    ]
+            'body': body
+        })
 
     return {
         'id': post['id'],
@@ -289,15 +588,33 @@ def format_post_for_claude(post: Dict) -> Dict:
         'created_datetime': post['created_datetime'],
         'permalink': post['permalink'],
         'selftext': selftext,
-        'heuristic_score': post['heuristic_score'],
+        'heuristic_score': heuristic_score,
         'top_comments': formatted_comments
     }
 
 
+def _offer_top(heap: List[tuple], top_n: int, item: tuple) -> None:
+    """
+    Add an item to a min-heap that keeps only the top_n largest items.
+
+    Args:
+        heap: Heap list, modified in place
+        top_n: Maximum number of items to keep
+        item: Comparable item to offer
+    """
+    if len(heap) < top_n:
+        heappush(heap, item)
+    elif heap and item > heap[0]:
+        heapreplace(heap, item)
+
+
 def preprocess_posts(
     raw_data: Dict,
     config: Dict,
-    top_n: int = 50
+    top_n: int = 50,
+    use_jit: bool = False,
+    parallel: bool = False,
+    preprocessed_at: Optional[str] = None
 ) -> Dict:
     """
     Preprocess raw Reddit data for Claude summarization.
@@ -306,6 +623,9 @@ def preprocess_posts(
         raw_data: Raw data from fetch_reddit.py
         config: Configuration dictionary
         top_n: Number of top posts to keep
+        use_jit: Score with the Numba-compiled kernel when numba is installed
+        parallel: Use the multi-core Numba kernel (implies use_jit)
+        preprocessed_at: Timestamp to record in metadata (default: now, ISO-8601)
 
     Returns:
         Preprocessed data dictionary ready for Claude
@@ -325,8 +645,8 @@ def preprocess_posts(
         }
 
     # Parse time window from metadata
-    start = datetime.fromisoformat(metadata['start_time'].replace('Z', '+00:00'))
-    end = datetime.fromisoformat(metadata['end_time'].replace('Z', '+00:00'))
+    start = _parse_iso(metadata['start_time'])
+    end = _parse_iso(metadata['end_time'])
 
     # Get scoring weights
     weights = config.get('scoring', {})
@@ -334,37 +654,84 @@ def preprocess_posts(
     # Compute subreddit medians for normalization
     medians = compute_subreddit_medians(posts)
 
-    # Score all posts
-    for post in posts:
-        median_score = medians.get(post['subreddit'], DEFAULT_MEDIAN_SCORE)
-        post['heuristic_score'] = compute_heuristic_score(
-            post, median_score, start, end, weights
-        )
-
-    # Sort by heuristic score (use sorted() to avoid mutating input)
-    sorted_posts = sorted(posts, key=lambda x: x['heuristic_score'], reverse=True)
-
-    # Take top N
-    top_posts = sorted_posts[:top_n]
-
-    # Format for Claude
-    formatted_posts = [format_post_for_claude(p) for p in top_posts]
+    # Score all posts (compiled or vectorized when available and worthwhile)
+    heuristic_scores = None
+    if use_jit or parallel:
+        try:
+            heuristic_scores = score_posts_jit(
+                posts, medians, start, end, weights, parallel=parallel
+            )
+        except ImportError:
+            print("Warning: numba/numpy not installed, ignoring --jit/--parallel",
+                  file=sys.stderr)
+    if heuristic_scores is None and np is not None and len(posts) >= VECTORIZE_MIN_POSTS:
+        heuristic_scores = score_posts_vectorized(posts, medians, start, end, weights)
+
+    # Select the top N while scoring, in a bounded min-heap of
+    # (score, -index); -index keeps earlier posts first on ties
+    top_heap = []
+    if heuristic_scores is not None:
+        for idx, heuristic_score in enumerate(heuristic_scores):
+            _offer_top(top_heap, top_n, (heuristic_score, -idx))
+    else:
+        # Per-run constants, hoisted out of the per-post loop
+        log_medians = {sr: compute_log_median(m) for sr, m in medians.items()}
+        default_log_median = compute_log_median(DEFAULT_MEDIAN_SCORE)
+        start_ts = start.timestamp()
+        window_duration = (end - start).total_seconds()
+        score_post = make_heuristic_scorer(weights)
+        for view in make_post_views(posts):
+            # Once the heap is full, posts that can't beat its minimum are
+            # rejected after the two cheapest components
+            heuristic_score = score_post(
+                view,
+                log_medians.get(view.subreddit, default_log_median),
+                start_ts,
+                window_duration,
+                min_score=top_heap[0][0] if len(top_heap) >= top_n > 0 else None
+            )
+            if heuristic_score is not None:
+                _offer_top(top_heap, top_n, (heuristic_score, -view.idx))
+
+    # Format the top N for Claude, highest score first
+    formatted_posts = [
+        format_post_for_claude(posts[-neg_idx], heuristic_score)
+        for heuristic_score, neg_idx in sorted(top_heap, reverse=True)
+    ]
 
     return {
         'metadata': {
             **metadata,
-            'preprocessed_at': datetime.now(timezone.utc).isoformat()
+            'preprocessed_at': preprocessed_at or datetime.now(timezone.utc).isoformat()
         },
         'posts': formatted_posts,
         'preprocessing': {
-            'input_count': len(raw_data.get('posts', [])),
+            'input_count': len(posts),
             'output_count': len(formatted_posts),
-            'filtered_count': len(raw_data.get('posts', [])) - len(formatted_posts),
+            'filtered_count': len(posts) - len(formatted_posts),
             'subreddit_medians': medians
         }
     }
 
 
+def load_raw_data(input_path: Path) -> Dict:
+    """
+    Load raw fetch output, decompressing .zst files transparently.
+
+    Args:
+        input_path: Path to raw_posts.json or raw_posts.json.zst
+
+    Returns:
+        Raw data dictionary
+    """
+    with open(input_path, 'rb') as f:
+        if input_path.suffix == '.zst':
+            import zstandard
+            with zstandard.ZstdDecompressor().stream_reader(f) as reader:
+                return orjson.loads(reader.read())
+        return orjson.loads(f.read())
+
+
 def main():
     """
     CLI interface for preprocessing Reddit data.
@@ -396,6 +763,22 @@ def main():
         type=int,
         default=50
     )
+    arg_parser.add_argument(
+        '--pretty',
+        help='Indent the output JSON (default); --no-pretty writes compact JSON',
+        action=argparse.BooleanOptionalAction,
+        default=True
+    )
+    arg_parser.add_argument(
+        '--jit',
+        help='Score posts with a Numba-compiled kernel (worthwhile for thousands of posts)',
+        action='store_true'
+    )
+    arg_parser.add_argument(
+        '--parallel',
+        help='Like --jit, but spread scoring across all CPU cores',
+        action='store_true'
+    )
     arg_parser.add_argument(
         '--output-dir', '-d',
         help='Output directory (overrides --input and --output, uses raw_posts.json and processed_posts.json inside)',
@@ -408,6 +791,10 @@ def main():
     if args.output_dir:
         input_path = Path(args.output_dir) / 'raw_posts.json'
         output_path = Path(args.output_dir) / 'processed_posts.json'
+        # Fall back to compressed fetch output (fetch_reddit.py --compress)
+        compressed_path = input_path.with_name(input_path.name + '.zst')
+        if not input_path.exists() and compressed_path.exists():
+            input_path = compressed_path
     else:
         input_path = Path(args.input)
         output_path = Path(args.output)
@@ -423,17 +810,18 @@ def main():
 
     # Load raw data
     try:
-        with open(input_path, 'r', encoding='utf-8') as f:
-            raw_data = json.load(f)
+        raw_data = load_raw_data(input_path)
     except FileNotFoundError:
         print(f"Error: Input file not found: {input_path}", file=sys.stderr)
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"Error: Invalid JSON in {input_path}: {e}", file=sys.stderr)
         sys.exit(1)
 
     # Preprocess
-    processed_data = preprocess_posts(raw_data, config, args.top)
+    processed_data = preprocess_posts(
+        raw_data, config, args.top, use_jit=args.jit, parallel=args.parallel
+    )
 
     # Report
     prep = processed_data['preprocessing']
@@ -445,9 +833,12 @@ def main():
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write output
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(processed_data, f, indent=2, ensure_ascii=False)
+    # Write output (orjson emits UTF-8 bytes directly, like ensure_ascii=False).
+    # Indented by default: the digest step reads this file line by line.
+    with open(output_path, 'wb') as f:
+        f.write(orjson.dumps(
+            processed_data, option=orjson.OPT_INDENT_2 if args.pretty else 0
+        ))
 
     print(f"Output written to: {output_path}", file=sys.stderr)
 